@@ -113,10 +113,7 @@ class App(Adw.Application):
         # Apply renaming action
         self.__apply_action = Gio.SimpleAction.new(name=ActionNames.APPLY_RENAMING)
         self.add_action(self.__apply_action)
-        self.__apply_action.connect(
-            "activate",
-            lambda *_: self.__model.apply_renaming(),
-        )
+        self.__apply_action.connect("activate", self.__on_apply_requested)
         self.set_accels_for_action(
             f"app.{ActionNames.APPLY_RENAMING}",
             [f"{PRIMARY_KEY}Return"],
@@ -142,7 +139,7 @@ class App(Adw.Application):
             [f"{PRIMARY_KEY}z"],
         )
         self.__model.bind_property(
-            source_property="is-apply-enabled",
+            source_property="is-undo-enabled",
             target=self.__undo_renaming_action,
             target_property="enabled",
             flags=GObject.BindingFlags.SYNC_CREATE,
@@ -188,6 +185,11 @@ class App(Adw.Application):
         )
         self.__window.present()
 
+    def __on_apply_requested(self, *_args):
+        """Apply the renaming, including the user input that is still debounced."""
+        self.__window.flush_pending_changes()
+        self.__model.apply_renaming()
+
     def __on_files_picker_requested(self, *_args):
         """Make the user select files to rename."""
         self.__files_picker.open_multiple(
@@ -208,17 +210,18 @@ class App(Adw.Application):
         except GLib.Error:
             return
 
-        gio_files = [
-            item
-            for i in range(paths_list_model.get_n_items())
-            if (item := cast(Gio.File | None, paths_list_model.get_item(i))) is not None
-        ]
-        self.__model.picked_paths = [
-            path
-            for gio_file in gio_files
-            if (path := gio_file.get_path())
-            if path is not None
-        ]
+        # Single pass over the list model, skipping files without a local path
+        get_item = paths_list_model.get_item
+        paths: list[str] = []
+        append = paths.append
+        for i in range(paths_list_model.get_n_items()):
+            gio_file = cast(Gio.File | None, get_item(i))
+            if gio_file is None:
+                continue
+            path = gio_file.get_path()
+            if path is not None:
+                append(path)
+        self.__model.picked_paths = paths
 
 
 def main():
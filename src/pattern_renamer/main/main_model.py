@@ -1,10 +1,15 @@
+import logging
+import os
 import re
+import sys
+import threading
 import unicodedata
-from collections import defaultdict
-from pathlib import Path
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from re import Pattern
 
-from gi.repository import Gio, GObject  # type: ignore
+from gi.repository import Gio, GLib, GObject  # type: ignore
 from pathvalidate import ValidationError, validate_filepath
 
 from pattern_renamer.main.build_constants import APP_ID
@@ -19,6 +24,46 @@ from pattern_renamer.main.types.mistakes import (
 )  # type: ignore
 from pattern_renamer.main.types.rename_target import RenameTarget
 
+# Only MacOS file systems hand out NFD paths, see MainModel._normalize_utf8
+IS_MACOS = sys.platform == "darwin"
+
+# Default file systems of MacOS (APFS) and Windows (NTFS) ignore the names' case.
+# Note: case sensitive volumes there get spurious conflicts, which is the safe side.
+IS_CASE_INSENSITIVE = IS_MACOS or sys.platform == "win32"
+
+NFC_CACHE_SIZE = 1024
+VALIDATION_CACHE_SIZE = 4096
+RECOMPUTE_DELAY_MS = 30
+MOVE_WORKERS = 8
+
+# Quick destination validation rules, see MainModel._is_invalid_destination
+MAX_NAME_LENGTH = 255
+if sys.platform == "win32":
+    FORBIDDEN_NAME_CHARS = re.compile(r'[\x00-\x1f<>:"|?*]')
+    RESERVED_NAMES = frozenset(
+        ("CON", "PRN", "AUX", "NUL")
+        + tuple(f"COM{i}" for i in range(1, 10))
+        + tuple(f"LPT{i}" for i in range(1, 10))
+    )
+elif IS_MACOS:
+    FORBIDDEN_NAME_CHARS = re.compile(r"[\x00:]")
+    RESERVED_NAMES = frozenset()
+else:
+    FORBIDDEN_NAME_CHARS = re.compile(r"\x00")
+    RESERVED_NAMES = frozenset()
+
+# Directory prefix (with its trailing separator), name, stem and extension of a path
+PathParts = tuple[str, str, str, str]
+
+# Bound Pattern.subn method, taking a replace pattern and a string
+Substitute = Callable[[str, str], tuple[str, int]]
+
+# Renamed path, and whether it differs from the picked path
+Renaming = tuple[str, bool]
+
+# Source and destination paths of a move
+Move = tuple[str, str]
+
 
 class MainModel(GObject.Object):
     """MVC model for the main application logic."""
@@ -26,9 +71,40 @@ class MainModel(GObject.Object):
     __gschema: Gio.Settings
     """Persistent settings storage"""
 
+    __compiled_regex: tuple[str, Pattern | None, bool]
+    """Last compiled regex, as (source, pattern, is_invalid)"""
+
+    __nfc_cache: OrderedDict[str, str]
+    """LRU cache of the NFC normalized strings"""
+
+    __rename_cache: dict[str, Renaming]
+    """Renamings of the picked paths, for the last renaming context"""
+
+    __rename_cache_context: tuple[str, str, str]
+    """Renaming context of the cache, as (regex source, replace pattern, target)"""
+
+    __validation_cache: dict[str, bool]
+    """FIFO cache of whether a renamed path is invalid for the current platform"""
+
+    __dir_listing_cache: dict[str, set[str]]
+    """Entry names of the directories containing renamed paths"""
+
+    __pending_recompute_id: int | None = None
+    """GLib source id of the scheduled recompute, if any"""
+
+    __is_moving: bool = False
+    """Whether paths are being moved in the background, which suspends recomputes"""
+
+    __applied_moves: list[Move]
+    """Moves done by the last renaming, that undoing reverts"""
+
+    __move_executor: ThreadPoolExecutor
+    """Thread pool running the moves, its threads are only started when needed"""
+
     # --- Inbound properties
 
     __picked_paths: list[str]
+    __path_parts: list[PathParts]
 
     @GObject.Property(type=object)
     def picked_paths(self) -> list[str]:
@@ -36,8 +112,14 @@ class MainModel(GObject.Object):
 
     @picked_paths.setter
     def picked_paths_setter(self, value: list[str]) -> None:
+        # Picking paths (even the same ones) refreshes the existing paths
+        self.__dir_listing_cache.clear()
+        if value is self.__picked_paths or value == self.__picked_paths:
+            self.__schedule_recompute()
+            return
         self.__picked_paths = [self._normalize_utf8(s) for s in value]
-        self.recompute()
+        self.__path_parts = [self._split_path(p) for p in self.__picked_paths]
+        self.__schedule_recompute()
 
     __regex: str = ""
 
@@ -48,7 +130,7 @@ class MainModel(GObject.Object):
     @regex.setter
     def regex_setter(self, value: str) -> None:
         self.__regex = self._normalize_utf8(value)
-        self.recompute()
+        self.__schedule_recompute()
 
     __replace_pattern: str = ""
 
@@ -59,7 +141,7 @@ class MainModel(GObject.Object):
     @replace_pattern.setter
     def replace_pattern_setter(self, value: str) -> None:
         self.__replace_pattern = self._normalize_utf8(value)
-        self.recompute()
+        self.__schedule_recompute()
 
     __rename_target: RenameTarget = RenameTarget.NAME
 
@@ -70,7 +152,7 @@ class MainModel(GObject.Object):
     @rename_target.setter
     def rename_target_setter(self, value: RenameTarget) -> None:
         self.__rename_target = value
-        self.recompute()
+        self.__schedule_recompute()
 
     # --- Outbound properties
 
@@ -85,6 +167,15 @@ class MainModel(GObject.Object):
     def __init__(self):
         super().__init__()
         self.__picked_paths = []
+        self.__path_parts = []
+        self.__compiled_regex = ("", None, False)
+        self.__nfc_cache = OrderedDict()
+        self.__rename_cache = {}
+        self.__rename_cache_context = ("", "", "")
+        self.__validation_cache = {}
+        self.__dir_listing_cache = {}
+        self.__applied_moves = []
+        self.__move_executor = ThreadPoolExecutor(max_workers=MOVE_WORKERS)
 
         # Bind the persistent settings
         self.__gschema = Gio.Settings.new(APP_ID)
@@ -95,6 +186,9 @@ class MainModel(GObject.Object):
             flags=Gio.SettingsBindFlags.DEFAULT,
         )
 
+        # Compute the initial outbound properties
+        self.recompute()
+
     def _normalize_utf8(self, string: str) -> str:
         """
         Normalize a string to a consistent UTF-8 form.<br/>
@@ -105,100 +199,205 @@ class MainModel(GObject.Object):
 
         - On some platforms (ex. MacOS) UTF-8 paths use the NFD normalization form, but text inputs use NFC.
         - On others (ex. Linux) they use NFC everywhere.
+
+        Since text inputs and non MacOS paths already are NFC, this is a no-op
+        outside of MacOS. There, ASCII strings are invariant under normalization
+        and returned as-is, other results are kept in a small LRU cache.
         """
-        return unicodedata.normalize("NFC", string)
+        if not IS_MACOS or string.isascii():
+            return string
+        cache = self.__nfc_cache
+        try:
+            normalized = cache[string]
+        except KeyError:
+            normalized = unicodedata.normalize("NFC", string)
+            cache[string] = normalized
+            if len(cache) > NFC_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(string)
+        return normalized
+
+    def __schedule_recompute(self) -> None:
+        """Schedule a recompute, coalescing bursts of inbound property changes"""
+        if self.__pending_recompute_id is None:
+            self.__pending_recompute_id = GLib.timeout_add(
+                RECOMPUTE_DELAY_MS, self.__on_recompute_timeout
+            )
+
+    def __on_recompute_timeout(self) -> bool:
+        self.__pending_recompute_id = None
+        self.recompute()
+        return GLib.SOURCE_REMOVE
+
+    def __flush_recompute(self) -> None:
+        """Run the scheduled recompute immediately, if any"""
+        if self.__pending_recompute_id is not None:
+            self.recompute()
 
     def recompute(self) -> None:
         """Recompute the outbound properties based on the inbound properties"""
 
+        # Supersede the scheduled recompute, if any
+        if self.__pending_recompute_id is not None:
+            GLib.source_remove(self.__pending_recompute_id)
+            self.__pending_recompute_id = None
+
+        # The outbound properties describe the paths being moved, keep them as-is.
+        # Note: the inbound properties are still stored, and used once moves are done.
+        if self.__is_moving:
+            return
+
+        # Emit the property notifications at once, after all have been updated
+        with self.freeze_notify():
+            self.__update_outbound_properties()
+
+    def __update_outbound_properties(self) -> None:
+        # Read the inbound properties once, bypassing the property getters
+        picked_paths = self.__picked_paths
+        regex_source = self.__regex
+        replace_pattern = self.__replace_pattern
+        target = self.__rename_target
+
+        # Short circuit, there is nothing to rename
+        if not picked_paths:
+            self.__set_renamed_paths([])
+            self.__set_mistakes([])
+            self.is_apply_enabled = False
+            self.app_state = AppState.EMPTY
+            return
+
         # Set the app state
-        self.app_state = AppState.RENAMING if self.picked_paths else AppState.EMPTY
+        self.app_state = AppState.RENAMING
 
         mistakes: list[Mistake] = []
 
-        # Parse the regex
+        # Parse the regex, reusing the last result if the source didn't change
         regex: Pattern | None = None
-        if self.regex:
-            try:
-                regex = re.compile(pattern=self.regex)
-            except re.error:
+        if regex_source:
+            if self.__compiled_regex[0] != regex_source:
+                try:
+                    compiled = re.compile(pattern=regex_source)
+                except re.error:
+                    self.__compiled_regex = (regex_source, None, True)
+                else:
+                    self.__compiled_regex = (regex_source, compiled, False)
+            _source, regex, is_invalid = self.__compiled_regex
+            if is_invalid:
                 mistakes.append(InvalidRegexMistake())
 
         # Rename the paths if plausible
-        if regex and self.replace_pattern:
+        renamed_paths: list[str] = self.renamed_paths
+        is_changed = False
+        if regex and replace_pattern:
+            # Resolve the loop invariants once
+            rename = self._get_rename_function(target)
+            sub = regex.subn
+            new_renamed_paths: list[str] = []
+            append = new_renamed_paths.append
+
+            # Reuse the renamings of the previous recompute if its context matches.
+            # Note: only the current paths are kept, which bounds the cache size.
+            context = (regex_source, replace_pattern, target)
+            if context == self.__rename_cache_context:
+                previous_cache = self.__rename_cache
+            else:
+                previous_cache = {}
+            rename_cache: dict[str, Renaming] = {}
+
             try:
-                self.renamed_paths = [
-                    self._rename(
-                        regex=regex,
-                        path=path,
-                        replace_pattern=self.replace_pattern,
-                        target=self.rename_target,
-                    )
-                    for path in self.picked_paths
-                ]
+                for path, parts in zip(picked_paths, self.__path_parts):
+                    renaming = previous_cache.get(path)
+                    if renaming is None:
+                        renaming = rename(sub, replace_pattern, path, parts)
+                    rename_cache[path] = renaming
+                    renamed_path, is_renamed = renaming
+                    append(renamed_path)
+                    is_changed = is_changed or is_renamed
             except re.error:
                 mistakes.append(InvalidReplacePatternMistake())
             else:
+                self.__rename_cache = rename_cache
+                self.__rename_cache_context = context
+                renamed_paths = new_renamed_paths
                 mistakes.extend(
                     self._detect_renamed_paths_mistakes(
-                        renamed_paths=self.renamed_paths,
-                        picked_paths=self.picked_paths,
+                        renamed_paths=renamed_paths,
+                        picked_paths=picked_paths,
                     )
                 )
         else:
             # Do a noop to display something in the renamed paths
-            self.renamed_paths = self.picked_paths.copy()
+            renamed_paths = picked_paths
 
-        self.mistakes = mistakes
+        self.__set_renamed_paths(renamed_paths)
+        self.__set_mistakes(mistakes)
         self.is_apply_enabled = (
-            self.regex
-            and self.replace_pattern
-            and self.picked_paths
-            and self.picked_paths != self.renamed_paths
-            and not self.mistakes
+            bool(regex_source) and bool(replace_pattern) and is_changed and not mistakes
         )
 
-    def _rename(
-        self, regex: Pattern, path: str, replace_pattern: str, target: RenameTarget
-    ) -> str:
-        """Rename the path based on the regex and replace pattern."""
+    def __set_renamed_paths(self, renamed_paths: list[str]) -> None:
+        """Set the renamed paths, skipping the notification if they didn't change"""
+        if renamed_paths != self.renamed_paths:
+            self.renamed_paths = renamed_paths
+
+    def __set_mistakes(self, mistakes: list[Mistake]) -> None:
+        """Set the mistakes, skipping the notification if they didn't change"""
+        current = self.mistakes
+        if current is None or len(mistakes) != len(current):
+            self.mistakes = mistakes
+            return
+        # Note: mistakes are compared by value, as they are recreated every recompute
+        for new, old in zip(mistakes, current):
+            if type(new) is not type(old) or vars(new) != vars(old):
+                self.mistakes = mistakes
+                return
+
+    def _get_rename_function(
+        self, target: RenameTarget
+    ) -> Callable[[Substitute, str, str, PathParts], Renaming]:
+        """Get the function renaming a path for the given rename target."""
         match target:
             case RenameTarget.FULL:
-                return self._rename_using_full_path(
-                    regex=regex, replace_pattern=replace_pattern, path=path
-                )
+                return self._rename_using_full_path
             case RenameTarget.NAME:
-                return self._rename_using_name(
-                    regex=regex, replace_pattern=replace_pattern, path=path
-                )
+                return self._rename_using_name
             case RenameTarget.STEM:
-                return self._rename_using_stem(
-                    regex=regex, replace_pattern=replace_pattern, path=path
-                )
+                return self._rename_using_stem
             case _:
-                raise ValueError(f"Unknown rename target: {self.rename_target}")
+                raise ValueError(f"Unknown rename target: {target}")
+
+    def _split_path(self, path: str) -> PathParts:
+        """Split a path into its directory prefix, name, stem and extension."""
+        head, name = os.path.split(path)
+        stem, extension = os.path.splitext(name)
+        return (os.path.join(head, ""), name, stem, extension)
 
     def _rename_using_full_path(
-        self, regex: Pattern, replace_pattern: str, path: str
-    ) -> str:
+        self, sub: Substitute, replace_pattern: str, path: str, parts: PathParts
+    ) -> Renaming:
         """Rename the full path based on the regex and replace pattern."""
-        return regex.sub(replace_pattern, path)
+        renamed_path, count = sub(replace_pattern, path)
+        return renamed_path, count > 0 and renamed_path != path
 
     def _rename_using_name(
-        self, regex: Pattern, replace_pattern: str, path: str
-    ) -> str:
+        self, sub: Substitute, replace_pattern: str, path: str, parts: PathParts
+    ) -> Renaming:
         """Rename the file name based on the regex and replace pattern."""
-        p = Path(path)
-        name = regex.sub(replace_pattern, p.name)
-        return str(p.parent / name)
+        prefix, name, _stem, _extension = parts
+        renamed_name, count = sub(replace_pattern, name)
+        return prefix + renamed_name, count > 0 and renamed_name != name
 
     def _rename_using_stem(
-        self, regex: Pattern, replace_pattern: str, path: str
-    ) -> str:
+        self, sub: Substitute, replace_pattern: str, path: str, parts: PathParts
+    ) -> Renaming:
         """Rename the file stem based on the regex and replace pattern."""
-        p = Path(path)
-        name = p.with_stem(f"{regex.sub(replace_pattern, p.stem)}")
-        return str(p.parent / name)
+        prefix, _name, stem, extension = parts
+        renamed_stem, count = sub(replace_pattern, stem)
+        return (
+            prefix + renamed_stem + extension,
+            count > 0 and renamed_stem != stem,
+        )
 
     def _detect_renamed_paths_mistakes(
         self, renamed_paths: list[str], picked_paths: list[str]
@@ -206,55 +405,206 @@ class MainModel(GObject.Object):
         """Check for mistakes in the renamed paths."""
 
         mistakes: list[Mistake] = []
-        buckets: defaultdict[str, list[int]] = defaultdict(list)
+        occurrences = Counter(renamed_paths)
+        validation_cache = self.__validation_cache
 
         for i, (picked_path, renamed_path) in enumerate(
             zip(picked_paths, renamed_paths)
         ):
-            # Check for duplicates
-            if renamed_path in buckets:
-                # If first duplicate, also add a mistake for the first occurrence
-                if len(buckets[renamed_path]) == 1:
-                    mistakes.append(DuplicateMistake(buckets[renamed_path][0]))
-                # Add a mistake for the current duplicate
+            # Check for duplicates, every occurrence is a mistake
+            if occurrences[renamed_path] > 1:
                 mistakes.append(DuplicateMistake(i))
-            buckets[renamed_path].append(i)
 
             # Validate that the path is valid for the current platform
-            try:
-                validate_filepath(file_path=renamed_path, platform="auto")
-            except ValidationError:
+            is_invalid = validation_cache.get(renamed_path)
+            if is_invalid is None:
+                is_invalid = self._is_invalid_destination(renamed_path)
+                if len(validation_cache) >= VALIDATION_CACHE_SIZE:
+                    del validation_cache[next(iter(validation_cache))]
+                validation_cache[renamed_path] = is_invalid
+            if is_invalid:
                 mistakes.append(InvalidDestinationMistake(i))
 
             # Check if the path already exists and is not the same as the original
-            if renamed_path != picked_path and Path(renamed_path).exists():
-                mistakes.append(ExistsMistake(i))
+            if renamed_path != picked_path:
+                directory, name = os.path.split(renamed_path)
+                if IS_CASE_INSENSITIVE:
+                    name = name.casefold()
+                if name in self.__get_dir_listing(directory):
+                    mistakes.append(ExistsMistake(i))
 
         # Set the mistakes, if any
         return mistakes
 
+    def _is_invalid_destination(self, path: str) -> bool:
+        """
+        Quickly check whether a destination path is invalid for the current platform.
+
+        This covers forbidden characters, reserved names and name lengths without
+        the cost of `validate_filepath`, which is only ran before applying.
+        """
+        _drive, path = os.path.splitdrive(path)
+        if os.altsep:
+            path = path.replace(os.altsep, os.sep)
+        names = path.split(os.sep)
+        if not names[-1]:
+            return True
+        for name in names:
+            if (
+                len(name.encode()) > MAX_NAME_LENGTH
+                or FORBIDDEN_NAME_CHARS.search(name)
+                or name.split(".", 1)[0].upper() in RESERVED_NAMES
+            ):
+                return True
+        return False
+
+    def _detect_invalid_destinations(self, renamed_paths: list[str]) -> list[Mistake]:
+        """Thoroughly validate the renamed paths for the current platform."""
+        mistakes: list[Mistake] = []
+        for i, renamed_path in enumerate(renamed_paths):
+            try:
+                validate_filepath(file_path=renamed_path, platform="auto")
+            except ValidationError:
+                mistakes.append(InvalidDestinationMistake(i))
+        return mistakes
+
+    def __get_dir_listing(self, directory: str) -> set[str]:
+        """
+        Get the set of entry names in a directory.
+
+        Listings are cached so that checking for existing paths costs a single
+        `scandir` per directory instead of a `stat` per path.
+        On case insensitive platforms, the names are casefolded.
+        """
+        listing = self.__dir_listing_cache.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    listing = {self._normalize_utf8(entry.name) for entry in entries}
+                if IS_CASE_INSENSITIVE:
+                    listing = {name.casefold() for name in listing}
+            except OSError:
+                listing = set()
+            self.__dir_listing_cache[directory] = listing
+        return listing
+
+    def __invalidate_dir_listings(self, paths: Iterable[str]) -> None:
+        """Drop the cached listings of the directories containing the given paths"""
+        for path in paths:
+            self.__dir_listing_cache.pop(os.path.dirname(path), None)
+
+    def __move_in_background(
+        self,
+        moves: list[Move],
+        on_done: Callable[[list[Move], list[Move]], None],
+    ) -> None:
+        """
+        Move paths in a thread pool, then call `on_done` from the main loop
+        with the moves that succeeded and the ones that failed.
+
+        Moves target independent paths (duplicates and existing destinations
+        are mistakes), so they may run concurrently without blocking the UI.
+        """
+
+        # Short circuit
+        if not moves:
+            on_done([], [])
+            return
+
+        self.__is_moving = True
+        futures = [
+            self.__move_executor.submit(os.rename, src, dst) for src, dst in moves
+        ]
+
+        # Once the last move is done, report back to the main loop
+        remaining = len(futures)
+        lock = threading.Lock()
+
+        def on_future_done(_future: Future) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining:
+                    return
+            GLib.idle_add(self.__on_moves_done, moves, futures, on_done)
+
+        for future in futures:
+            future.add_done_callback(on_future_done)
+
+    def __on_moves_done(
+        self,
+        moves: list[Move],
+        futures: list[Future],
+        on_done: Callable[[list[Move], list[Move]], None],
+    ) -> bool:
+        self.__is_moving = False
+        succeeded: list[Move] = []
+        failed: list[Move] = []
+        for move, future in zip(moves, futures):
+            self.__invalidate_dir_listings(move)
+            if (error := future.exception()) is None:
+                succeeded.append(move)
+            else:
+                logging.error("Could not move %s to %s: %s", *move, error)
+                failed.append(move)
+        on_done(succeeded, failed)
+        return GLib.SOURCE_REMOVE
+
     def apply_renaming(self) -> None:
         """Apply the renaming to the picked paths"""
-        for picked, renamed in (
+
+        # Note: a renaming must be undone before applying another one
+        if self.__is_moving or self.app_state == AppState.RENAMED:
+            return
+
+        # Make sure that the renaming reflects the latest inbound properties
+        self.__flush_recompute()
+        if not self.is_apply_enabled:
+            return
+
+        # Run the thorough validation that the interactive checks skip
+        if mistakes := self._detect_invalid_destinations(self.renamed_paths):
+            self.mistakes = mistakes
+            self.is_apply_enabled = False
+            return
+
+        moves = [
             (picked, renamed)
             for (picked, renamed) in zip(self.picked_paths, self.renamed_paths)
             if picked != renamed
-        ):
-            # TODO - Handle errors during renaming
-            # Renaming should be atomic, so if one fails, none should be applied
-            Path(picked).rename(renamed)
+        ]
+        self.__move_in_background(moves, self.__on_renaming_applied)
+
+    def __on_renaming_applied(self, succeeded: list[Move], failed: list[Move]) -> None:
+        # Note: inbound changes made while moving are not reflected until undone
+        if succeeded:
+            self.__applied_moves = succeeded
+
+        # TODO - Renaming should be atomic, so if one fails, none should be applied
+        # Until then, refresh the mistakes and allow undoing the moves that succeeded
+        if failed:
+            self.recompute()
+            if not succeeded:
+                return
+
         self.app_state = AppState.RENAMED
+        self.is_apply_enabled = False
         self.is_undo_enabled = True
 
     def undo_renaming(self) -> None:
         """Undo the rename operation."""
-        for picked, renamed in (
-            (picked, renamed)
-            for (picked, renamed) in zip(self.picked_paths, self.renamed_paths)
-            if picked != renamed
-        ):
-            # TODO - Handle errors during undo renaming
-            # Renaming should be atomic, so if one fails, none should be applied
-            Path(renamed).rename(picked)
-        self.app_state = AppState.RENAMING
+
+        if self.__is_moving or not self.__applied_moves:
+            return
+
+        # Revert the moves that were actually done, regardless of later changes
+        moves = [(dst, src) for (src, dst) in reversed(self.__applied_moves)]
+        self.__move_in_background(moves, self.__on_renaming_undone)
+
+    def __on_renaming_undone(self, succeeded: list[Move], failed: list[Move]) -> None:
+        # Keep the moves that could not be reverted, so that undoing may be retried
+        self.__applied_moves = [(dst, src) for (src, dst) in reversed(failed)]
+        if failed:
+            return
         self.is_undo_enabled = False
+        self.recompute()
@@ -43,6 +43,7 @@ class MainWindow(Adw.ApplicationWindow):
     # ---
 
     __navigation: Adw.NavigationView
+    __renaming_page: RenamingPage
 
     def __init__(self, application: Adw.Application):
         super().__init__(application=application)
@@ -82,12 +83,17 @@ class MainWindow(Adw.ApplicationWindow):
         self.__navigation = build(
             Adw.NavigationView + Children(empty_page, renamed_page, renaming_page)
         )
+        self.__renaming_page = renaming_page
         self.set_content(self.__navigation)
         self.set_default_size(800, 600)
 
         if PROFILE == "development":
             self.add_css_class("devel")
 
+    def flush_pending_changes(self) -> None:
+        """Send the debounced user input changes right away"""
+        self.__renaming_page.flush_pending_changes()
+
     def __setup_drop_target(self) -> None:
         """Setup drop target to accept file drops"""
         drop_target = Gtk.DropTarget.new(type=Gdk.FileList, actions=Gdk.DragAction.COPY)
@@ -41,6 +41,8 @@ class RenameItemWidget(Gtk.Box):
 
     @mistake.setter
     def mistake_setter(self, value: RenameDestinationMistake | None) -> None:
+        if value is self.__mistake:
+            return
         self.__mistake = value
         if value:
             self.__mistake_label.set_text(value.message)
@@ -168,9 +170,16 @@ class RenameItemWidget(Gtk.Box):
 class RenameItemLifeCycleManager:
     """Class in charge of managing ListItem lifecycle for path widgets"""
 
+    __notify_handler_ids: dict[Gtk.ListItem, int]
+    """Handlers following the changes of the bound data, by list item"""
+
+    def __init__(self) -> None:
+        self.__notify_handler_ids = {}
+
     def attach_to(self, signal_factory: Gtk.SignalListItemFactory):
         """Attach the builder to the factory's signals"""
         signal_factory.connect("bind", self.__on_bind)
+        signal_factory.connect("unbind", self.__on_unbind)
         signal_factory.connect("setup", self.__on_setup)
 
     def __on_setup(self, factory: Gtk.SignalListItemFactory, item: Gtk.ListItem):
@@ -179,7 +188,25 @@ class RenameItemLifeCycleManager:
     def __on_bind(self, factory: Gtk.SignalListItemFactory, item: Gtk.ListItem):
         widget: RenameItemWidget = item.get_child()  # type: ignore
         data: RenameItemData = item.get_item()  # type: ignore
+        self.__sync(widget, data)
+
+        # Data items are updated in place, follow their changes while bound
+        self.__notify_handler_ids[item] = data.connect(
+            "notify", lambda data, _pspec: self.__sync(widget, data)
+        )
 
-        widget.picked_path = data.picked_path
-        widget.renamed_path = data.renamed_path
-        widget.mistake = data.mistake
+    def __on_unbind(self, factory: Gtk.SignalListItemFactory, item: Gtk.ListItem):
+        handler_id = self.__notify_handler_ids.pop(item, None)
+        if handler_id is not None:
+            item.get_item().disconnect(handler_id)  # type: ignore
+
+    def __sync(self, widget: RenameItemWidget, data: RenameItemData) -> None:
+        """Copy the data to the widget"""
+
+        # Only assign changed values, as each assignment relayouts the labels
+        if widget.picked_path != data.picked_path:
+            widget.picked_path = data.picked_path
+        if widget.renamed_path != data.renamed_path:
+            widget.renamed_path = data.renamed_path
+        if widget.mistake is not data.mistake:
+            widget.mistake = data.mistake
@@ -1,5 +1,6 @@
+import os
 from collections.abc import Callable
-from pathlib import Path
+from dataclasses import dataclass
 
 from gi.repository import Adw, Gio, GLib, GObject, Gtk  # type: ignore
 
@@ -20,9 +21,38 @@ from pattern_renamer.main.ui.widget_builder.widget_builder import (
     Handlers,
     Properties,
     TypedChild,
+    WidgetBuilder,
     build,
 )
 
+ENTRY_DEBOUNCE_MS = 50
+
+
+def _get_stem(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+# Transforms applied to the displayed paths for each rename target.
+# Note: None stands for the identity, and is skipped when building items.
+TARGET_TRANSFORMS: dict[str, Callable[[str], str] | None] = {
+    RenameTarget.FULL: None,
+    RenameTarget.NAME: os.path.basename,
+    RenameTarget.STEM: _get_stem,
+}
+
+
+@dataclass(frozen=True)
+class _RenamingPageTemplate:
+    """Static widget builders of the renaming page, completed by each instance"""
+
+    regex_row: WidgetBuilder
+    replace_pattern_row: WidgetBuilder
+    regex_section: WidgetBuilder
+    items_list_view: WidgetBuilder
+    items_view: WidgetBuilder
+    content_box: WidgetBuilder
+    content: WidgetBuilder
+
 
 class RenamingPage(Adw.NavigationPage):
     """Component for the renaming page of the application."""
@@ -40,7 +70,7 @@ class RenamingPage(Adw.NavigationPage):
     @picked_paths.setter
     def picked_paths_setter(self, paths: list[str]) -> None:
         self.__picked_paths = paths
-        self.__update_items_model()
+        self.__schedule_items_model_update()
 
     __renamed_paths: list[str]
 
@@ -51,7 +81,7 @@ class RenamingPage(Adw.NavigationPage):
     @renamed_paths.setter
     def renamed_paths_setter(self, paths: list[str]) -> None:
         self.__renamed_paths = paths
-        self.__update_items_model()
+        self.__schedule_items_model_update()
 
     __rename_target: RenameTarget
 
@@ -62,7 +92,7 @@ class RenamingPage(Adw.NavigationPage):
     @rename_target.setter
     def rename_target_setter(self, rename_target: RenameTarget) -> None:
         self.__rename_target = rename_target
-        self.__update_items_model()
+        self.__schedule_items_model_update()
 
     __mistakes: list[Mistake]
     __indexed_rename_destination_mistakes: dict[int, RenameDestinationMistake]
@@ -82,24 +112,35 @@ class RenamingPage(Adw.NavigationPage):
 
         ERROR_CSS_CLASS = "error"
 
+        # Sort the mistakes in a single pass
+        has_regex_mistake = False
+        has_replace_pattern_mistake = False
+        indexed_mistakes: dict[int, RenameDestinationMistake] = {}
+        for m in mistakes:
+            mistake_type = type(m)
+            if mistake_type is InvalidRegexMistake:
+                has_regex_mistake = True
+            elif mistake_type is InvalidReplacePatternMistake:
+                has_replace_pattern_mistake = True
+            elif isinstance(m, RenameDestinationMistake):
+                # Abstract, only its subclasses are instantiated
+                indexed_mistakes[m.culprit_index] = m
+
         # Update the regex editable
-        if any(isinstance(m, InvalidRegexMistake) for m in mistakes):
+        if has_regex_mistake:
             self.__regex_editable.add_css_class(ERROR_CSS_CLASS)
         else:
             self.__regex_editable.remove_css_class(ERROR_CSS_CLASS)
 
         # Update the replace pattern editable
-        if any(isinstance(m, InvalidReplacePatternMistake) for m in mistakes):
+        if has_replace_pattern_mistake:
             self.__replace_pattern_editable.add_css_class(ERROR_CSS_CLASS)
         else:
             self.__replace_pattern_editable.remove_css_class(ERROR_CSS_CLASS)
 
-        # Update the indexed mistakes
-        self.__indexed_rename_destination_mistakes = {
-            m.culprit_index: m
-            for m in mistakes
-            if isinstance(m, RenameDestinationMistake)
-        }
+        # Update the indexed mistakes, and the items that display them
+        self.__indexed_rename_destination_mistakes = indexed_mistakes
+        self.__schedule_items_model_update()
 
     # ---
 
@@ -112,7 +153,19 @@ class RenamingPage(Adw.NavigationPage):
     __regex_editable: Adw.EntryRow
     __replace_pattern_editable: Adw.EntryRow
 
-    def __get_menu_model(self) -> Gio.Menu:
+    __is_items_model_update_pending: bool = False
+    __regex_debounce_id: int = 0
+    __replace_pattern_debounce_id: int = 0
+
+    __menu_model: Gio.Menu | None = None
+    """Static menu model, shared by all the instances"""
+
+    @classmethod
+    def __get_menu_model(cls) -> Gio.Menu:
+        # The menu is static, build it once
+        if cls.__menu_model is not None:
+            return cls.__menu_model
+
         # Create a radio menu with 3 items for rename target selection.
         rename_target_action = f"app.{ActionNames.RENAME_TARGET}"
         full = Gio.MenuItem.new(label=_("Full path"))
@@ -144,9 +197,19 @@ class RenamingPage(Adw.NavigationPage):
             )
         )
 
+        cls.__menu_model = menu
         return menu
 
-    def __build(self) -> None:
+    __template: _RenamingPageTemplate | None = None
+    """Static widget builders, shared by all the instances"""
+
+    @classmethod
+    def __get_template(cls) -> _RenamingPageTemplate:
+        # The page skeleton is static, describe it once.
+        # Note: this is done lazily, since _ is only installed at runtime.
+        if cls.__template is not None:
+            return cls.__template
+
         margin = 12
         BOXED_LIST_PROPERTIES = Properties(
             css_classes=["boxed-list"],
@@ -155,7 +218,7 @@ class RenamingPage(Adw.NavigationPage):
 
         # Header and menu
         menu_button = Gtk.MenuButton + Properties(
-            icon_name="open-menu-symbolic", menu_model=self.__get_menu_model()
+            icon_name="open-menu-symbolic", menu_model=cls.__get_menu_model()
         )
         apply_button = (
             Gtk.Button
@@ -174,26 +237,60 @@ class RenamingPage(Adw.NavigationPage):
             + TypedChild("end", Gtk.Box + Children(apply_button, menu_button))
         )
 
+        cls.__template = _RenamingPageTemplate(
+            # Regex section
+            regex_row=Adw.EntryRow + Properties(title=_("Regular Expression")),
+            replace_pattern_row=Adw.EntryRow + Properties(title=_("Replace Pattern")),
+            regex_section=(
+                Gtk.ListBox
+                + BOXED_LIST_PROPERTIES
+                + Properties(
+                    margin_top=margin,
+                    margin_bottom=margin / 2,
+                    margin_start=margin,
+                    margin_end=margin,
+                )
+            ),
+            # Paths view definition
+            items_list_view=(
+                Gtk.ListView
+                + Properties(
+                    name="items-list-view",
+                    css_classes=["card"],
+                    margin_top=margin / 2,
+                    margin_bottom=margin,
+                    margin_start=margin,
+                    margin_end=margin,
+                    show_separators=False,
+                )
+            ),
+            items_view=(
+                Gtk.ScrolledWindow
+                + Properties(
+                    vexpand=True,
+                    hscrollbar_policy=Gtk.PolicyType.NEVER,
+                    vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+                )
+            ),
+            content_box=Gtk.Box + Properties(orientation=Gtk.Orientation.VERTICAL),
+            content=Adw.ToolbarView + TypedChild("top", header),
+        )
+        return cls.__template
+
+    def __build(self) -> None:
+        # Complete the static template with the instance's handlers and models
+        template = self.__get_template()
+
         # Regex section
         self.__regex_editable = build(
-            Adw.EntryRow
-            + Properties(title=_("Regular Expression"))
-            + Handlers(changed=self.__on_regex_changed)
+            template.regex_row + Handlers(changed=self.__on_regex_changed)
         )
         self.__replace_pattern_editable = build(
-            Adw.EntryRow
-            + Properties(title=_("Replace Pattern"))
+            template.replace_pattern_row
             + Handlers(changed=self.__on_replace_pattern_changed)
         )
         regex_section = build(
-            Gtk.ListBox
-            + BOXED_LIST_PROPERTIES
-            + Properties(
-                margin_top=margin,
-                margin_bottom=margin / 2,
-                margin_start=margin,
-                margin_end=margin,
-            )
+            template.regex_section
             + Children(
                 self.__regex_editable,
                 self.__replace_pattern_editable,
@@ -202,37 +299,19 @@ class RenamingPage(Adw.NavigationPage):
 
         # Paths view definition
         self.__items_list_view = build(
-            Gtk.ListView
+            template.items_list_view
             + Properties(
-                name="items-list-view",
-                css_classes=["card"],
                 model=self.__items_selection_model,
                 factory=self.__items_signal_factory,
-                margin_top=margin / 2,
-                margin_bottom=margin,
-                margin_start=margin,
-                margin_end=margin,
-                show_separators=False,
-            )
-        )
-        items_view = build(
-            Gtk.ScrolledWindow
-            + Properties(
-                vexpand=True,
-                hscrollbar_policy=Gtk.PolicyType.NEVER,
-                vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
             )
-            + Children(self.__items_list_view)
         )
+        items_view = build(template.items_view + Children(self.__items_list_view))
 
         content = build(
-            Adw.ToolbarView
-            + TypedChild("top", header)
+            template.content
             + TypedChild(
                 "content",
-                Gtk.Box
-                + Properties(orientation=Gtk.Orientation.VERTICAL)
-                + Children(regex_section, items_view),
+                template.content_box + Children(regex_section, items_view),
             )
         )
 
@@ -251,37 +330,89 @@ class RenamingPage(Adw.NavigationPage):
         self.__items_lifecycle_manager.attach_to(self.__items_signal_factory)
         self.__build()
 
-    def __on_regex_changed(self, editable: Gtk.Editable):
+    def __on_regex_changed(self, _editable: Gtk.Editable):
+        # Debounce, only the last text of a typing burst is sent
+        if self.__regex_debounce_id:
+            GLib.source_remove(self.__regex_debounce_id)
+        self.__regex_debounce_id = GLib.timeout_add(
+            ENTRY_DEBOUNCE_MS, self.__on_regex_debounce_timeout
+        )
+
+    def __on_regex_debounce_timeout(self) -> bool:
+        self.__regex_debounce_id = 0
+        self.__send_regex()
+        return GLib.SOURCE_REMOVE
+
+    def __send_regex(self) -> None:
         self.activate_action(
             name=f"app.{ActionNames.REGEX}",
-            args=GLib.Variant.new_string(editable.get_text()),
+            args=GLib.Variant.new_string(self.__regex_editable.get_text()),
         )
 
-    def __on_replace_pattern_changed(self, editable: Gtk.Editable):
+    def __on_replace_pattern_changed(self, _editable: Gtk.Editable):
+        # Debounce, only the last text of a typing burst is sent
+        if self.__replace_pattern_debounce_id:
+            GLib.source_remove(self.__replace_pattern_debounce_id)
+        self.__replace_pattern_debounce_id = GLib.timeout_add(
+            ENTRY_DEBOUNCE_MS, self.__on_replace_pattern_debounce_timeout
+        )
+
+    def __on_replace_pattern_debounce_timeout(self) -> bool:
+        self.__replace_pattern_debounce_id = 0
+        self.__send_replace_pattern()
+        return GLib.SOURCE_REMOVE
+
+    def __send_replace_pattern(self) -> None:
         self.activate_action(
             name=f"app.{ActionNames.REPLACE_PATTERN}",
-            args=GLib.Variant.new_string(editable.get_text()),
+            args=GLib.Variant.new_string(self.__replace_pattern_editable.get_text()),
         )
 
+    def flush_pending_changes(self) -> None:
+        """Send the debounced entry changes right away, eg. before applying"""
+        if self.__regex_debounce_id:
+            GLib.source_remove(self.__regex_debounce_id)
+            self.__regex_debounce_id = 0
+            self.__send_regex()
+        if self.__replace_pattern_debounce_id:
+            GLib.source_remove(self.__replace_pattern_debounce_id)
+            self.__replace_pattern_debounce_id = 0
+            self.__send_replace_pattern()
+
     def __on_mistake_banner_button_clicked(self, *_args):
         if not self.__mistakes:
             return
-        match first := self.__mistakes[0]:
-            case InvalidRegexMistake():
-                # Regex mistake, focus the regex editable.
-                self.__regex_editable.grab_focus()
-            case InvalidReplacePatternMistake():
-                # Replace pattern mistake, focus the replace pattern editable.
-                self.__replace_pattern_editable.grab_focus()
-            case RenameDestinationMistake():
-                # Destination mistake, focus the item
-                self.__items_list_view.grab_focus()
-                self.__items_list_view.scroll_to(
-                    first.culprit_index, flags=Gtk.ListScrollFlags.FOCUS
-                )
-            case _:
-                # For other mistakes, just log the message.
-                print(f"Unhandled mistake: {first.message}")
+        first = self.__mistakes[0]
+        first_type = type(first)
+        if first_type is InvalidRegexMistake:
+            # Regex mistake, focus the regex editable.
+            self.__regex_editable.grab_focus()
+        elif first_type is InvalidReplacePatternMistake:
+            # Replace pattern mistake, focus the replace pattern editable.
+            self.__replace_pattern_editable.grab_focus()
+        elif isinstance(first, RenameDestinationMistake):
+            # Destination mistake (abstract, matched by subclass), focus the item
+            self.__items_list_view.grab_focus()
+            self.__items_list_view.scroll_to(
+                first.culprit_index, flags=Gtk.ListScrollFlags.FOCUS
+            )
+        else:
+            # For other mistakes, just log the message.
+            print(f"Unhandled mistake: {first.message}")
+
+    def __schedule_items_model_update(self) -> None:
+        """Schedule an items model update, coalescing consecutive property changes"""
+        if self.__is_items_model_update_pending:
+            return
+        self.__is_items_model_update_pending = True
+        GLib.idle_add(
+            self.__on_items_model_update_idle, priority=GLib.PRIORITY_DEFAULT_IDLE
+        )
+
+    def __on_items_model_update_idle(self) -> bool:
+        self.__is_items_model_update_pending = False
+        self.__update_items_model()
+        return GLib.SOURCE_REMOVE
 
     def __update_items_model(self) -> None:
         """Update the path pairs model based on the current rename target."""
@@ -294,24 +425,63 @@ class RenamingPage(Adw.NavigationPage):
         ):
             return
 
-        transform: Callable[[str], str]
-        match self.rename_target:
-            case RenameTarget.FULL:
-                transform = lambda path: path  # noqa: E731
-            case RenameTarget.NAME:
-                transform = lambda path: Path(path).name  # noqa: E731
-            case RenameTarget.STEM:
-                transform = lambda path: Path(path).stem  # noqa: E731
-            case _:
-                raise ValueError(f"Unknown rename target: {self.rename_target}")
-
-        self.__items_model.remove_all()
-        for i, (picked, renamed) in enumerate(
-            zip(self.__picked_paths, self.__renamed_paths)
-        ):
-            rename_item_data = RenameItemData(
-                picked_path=transform(picked),
-                renamed_path=transform(renamed),
-                mistake=self.__indexed_rename_destination_mistakes.get(i),
+        if self.rename_target not in TARGET_TRANSFORMS:
+            raise ValueError(f"Unknown rename target: {self.rename_target}")
+        transform = TARGET_TRANSFORMS[self.rename_target]
+
+        # Lay the mistakes out densely, to zip them with the paths
+        n = len(self.__picked_paths)
+        mistakes: list[RenameDestinationMistake | None] = [None] * n
+        for i, mistake in self.__indexed_rename_destination_mistakes.items():
+            if i < n:
+                mistakes[i] = mistake
+
+        new_rows = [
+            (
+                picked if transform is None else transform(picked),
+                renamed if transform is None else transform(renamed),
+                mistake,
+            )
+            for picked, renamed, mistake in zip(
+                self.__picked_paths, self.__renamed_paths, mistakes
+            )
+        ]
+        self.__patch_items_model(new_rows)
+
+    def __patch_items_model(
+        self, new_rows: list[tuple[str, str, RenameDestinationMistake | None]]
+    ) -> None:
+        """
+        Update the items model to match the given rows.
+
+        Existing items are updated in place (only their changed properties), and items
+        are only added or removed when the row count changes.
+        This way, only the list rows that changed get updated.
+        """
+        model = self.__items_model
+        n_items = model.get_n_items()
+        n_rows = len(new_rows)
+
+        # Update the existing items
+        for i in range(min(n_items, n_rows)):
+            item: RenameItemData = model.get_item(i)  # type: ignore
+            picked, renamed, mistake = new_rows[i]
+            if item.picked_path != picked:
+                item.picked_path = picked
+            if item.renamed_path != renamed:
+                item.renamed_path = renamed
+            if item.mistake is not mistake:
+                item.mistake = mistake
+
+        # Add the extra items, or remove the surplus, at once
+        if n_rows > n_items:
+            model.splice(
+                n_items,
+                0,
+                [
+                    RenameItemData(picked_path=p, renamed_path=r, mistake=m)
+                    for p, r, m in new_rows[n_items:]
+                ],
             )
-            self.__items_model.append(rename_item_data)
+        elif n_rows < n_items:
+            model.splice(n_rows, n_items - n_rows, [])
@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Callable, Generic, Self, TypeVar
 
@@ -27,6 +27,22 @@ class OutboundBinding:
 
 Binding = InboundBinding | OutboundBinding
 
+# Builder operation tags, in the order their operations are applied when building
+(
+    _OP_ARGUMENTS,
+    _OP_HANDLERS,
+    _OP_PROPERTIES,
+    _OP_CHILDREN,
+    _OP_TYPED_CHILDREN,
+    _OP_PROPERTY_BINDINGS,
+) = range(6)
+
+_Op = tuple[int, Any]
+
+
+# WidgetBuilder and its subclasses, to tell builders apart with a set lookup
+_BUILDER_TYPES: set[type] = set()
+
 
 class WidgetBuilder(Generic[_BuiltWidget]):
     """
@@ -36,42 +52,53 @@ class WidgetBuilder(Generic[_BuiltWidget]):
     are callables that return `Widget`.
     """
 
-    __widget_class: type[_BuiltWidget]
-    __arguments: dict[str, Any]
-    __handlers: dict[str, Any]
-    __properties: dict[str, Any]
-    __children: list["WidgetBuilder | Widget | None"]
-    __typed_children: list[tuple[str, "WidgetBuilder | Widget"]]
-    __property_bindings: list[Binding]
+    __slots__ = ("__widget_class", "__ops")
+
+    __widget_class: None | type[_BuiltWidget]
+
+    # Note: ops are never mutated in place, adders replace them.
+    # This allows builders to share them, eg. when merged with __add__.
+    __ops: tuple[_Op, ...]
+    """Tagged operations, in the order they were added"""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _BUILDER_TYPES.add(cls)
 
     def __init__(self, widget_class: None | type[_BuiltWidget] = None) -> None:
         super().__init__()
-        if widget_class is not None:
-            self.set_widget_class(widget_class)
-        self.__arguments = {}
-        self.__handlers = {}
-        self.__properties = {}
-        self.__children = []
-        self.__typed_children = []
-        self.__property_bindings = []
+        self.__widget_class = widget_class
+        self.__ops = ()
 
     # Adders / Setters
 
+    def __add_op(self, tag: int, payload: Any) -> Self:
+        self.__ops = (*self.__ops, (tag, payload))
+        return self
+
     def set_widget_class(self, widget_class: type[_BuiltWidget]) -> Self:
         self.__widget_class = widget_class
         return self
 
     def add_arguments(self, **arguments: Any) -> Self:
-        self.__arguments |= arguments
-        return self
+        return self.__add_op(_OP_ARGUMENTS, arguments)
 
     def add_properties(self, **properties: Any) -> Self:
-        self.__properties |= properties
-        return self
+        # Note: keys are stored in their GObject (dashed) form
+        return self.__add_op(
+            _OP_PROPERTIES,
+            {key.replace("_", "-"): value for key, value in properties.items()},
+        )
 
     def add_handlers(self, **signal_handlers: Callable) -> Self:
-        self.__handlers |= signal_handlers
-        return self
+        # Note: signals are stored in their GObject (dashed) form
+        return self.__add_op(
+            _OP_HANDLERS,
+            {
+                signal.replace("_", "-"): handler
+                for signal, handler in signal_handlers.items()
+            },
+        )
 
     def add_children(self, *children: "WidgetBuilder | Widget | None") -> Self:
         """
@@ -86,8 +113,7 @@ class WidgetBuilder(Generic[_BuiltWidget]):
             (eg. the start and title of a `Adw.HeaderBar` when only the end is to be set)
         - Receives many children: all of them will be added.
         """
-        self.__children.extend(children)
-        return self
+        return self.__add_op(_OP_CHILDREN, children)
 
     def add_typed_children(
         self, *typed_children: tuple[str, "WidgetBuilder | Widget"]
@@ -98,47 +124,61 @@ class WidgetBuilder(Generic[_BuiltWidget]):
         Useful for cases where a `Widget` may receive children in multiple places,
         with a default.
         """
-        self.__typed_children.extend(typed_children)
-        return self
+        return self.__add_op(_OP_TYPED_CHILDREN, typed_children)
 
     def add_property_bindings(self, *bindings: Binding) -> Self:
         """Add a property binding to the widget builder."""
-        self.__property_bindings.extend(bindings)
-        return self
+        return self.__add_op(_OP_PROPERTY_BINDINGS, bindings)
 
     # Getters
 
-    def get_widget_class(self) -> type[_BuiltWidget]:
+    def __collect_mapping(self, tag: int) -> Mapping[str, Any]:
+        """Merge the mappings of every op with the given tag"""
+        merged: dict[str, Any] = {}
+        for op_tag, payload in self.__ops:
+            if op_tag == tag:
+                merged.update(payload)
+        return merged
+
+    def __collect_sequence(self, tag: int) -> Sequence:
+        """Concatenate the sequences of every op with the given tag"""
+        return [
+            item for op_tag, payload in self.__ops if op_tag == tag for item in payload
+        ]
+
+    def get_widget_class(self) -> None | type[_BuiltWidget]:
         return self.__widget_class
 
-    def get_arguments(self) -> dict[str, Any]:
-        return self.__arguments
+    def get_arguments(self) -> Mapping[str, Any]:
+        return self.__collect_mapping(_OP_ARGUMENTS)
 
-    def get_properties(self) -> dict[str, Any]:
-        return self.__properties
+    def get_properties(self) -> Mapping[str, Any]:
+        return self.__collect_mapping(_OP_PROPERTIES)
 
-    def get_handlers(self) -> dict[str, Any]:
-        return self.__handlers
+    def get_handlers(self) -> Mapping[str, Any]:
+        return self.__collect_mapping(_OP_HANDLERS)
 
-    def get_children(self) -> list["WidgetBuilder | Widget | None"]:
-        return self.__children
+    def get_children(self) -> Sequence["WidgetBuilder | Widget | None"]:
+        return self.__collect_sequence(_OP_CHILDREN)
 
-    def get_typed_children(self) -> list[tuple[str, "WidgetBuilder | Widget"]]:
-        return self.__typed_children
+    def get_typed_children(self) -> Sequence[tuple[str, "WidgetBuilder | Widget"]]:
+        return self.__collect_sequence(_OP_TYPED_CHILDREN)
 
-    def get_property_bindings(self) -> list[Binding]:
-        return self.__property_bindings
+    def get_property_bindings(self) -> Sequence[Binding]:
+        return self.__collect_sequence(_OP_PROPERTY_BINDINGS)
 
     # Build helpers
 
-    def __apply_properties(self, widget: _BuiltWidget) -> None:
+    def __apply_properties(
+        self, widget: _BuiltWidget, properties: Mapping[str, Any]
+    ) -> None:
         """Apply a set of properties to a widget"""
-        for key, value in self.__properties.items():
-            widget.set_property(key.replace("_", "-"), value)
+        for key, value in properties.items():
+            widget.set_property(key, value)
 
-    def __apply_handlers(self, widget: Widget) -> None:
-        for signal, handler in self.__handlers.items():
-            widget.connect(signal.replace("_", "-"), handler)
+    def __apply_handlers(self, widget: Widget, handlers: Mapping[str, Any]) -> None:
+        for signal, handler in handlers.items():
+            widget.connect(signal, handler)
 
     def __check_no_null_children(
         self, widget: Widget, children: Sequence[Widget | None]
@@ -167,83 +207,119 @@ class WidgetBuilder(Generic[_BuiltWidget]):
     ) -> Sequence[Widget | None]:
         """Resolve `WidgetProducer` children by calling them and producing their `Widget`"""
         return [
-            (build(child) if isinstance(child, WidgetBuilder) else child)
+            (child.build() if type(child) in _BUILDER_TYPES else child)  # type: ignore
             for child in children
         ]
 
-    def __apply_children(self, widget: Widget) -> None:
-        # Resolve children from producers
-        resolved = self.__resolve_children(self.__children)
+    # Children appliers, receiving the widget and its resolved children
 
-        # Short circuit
-        if not resolved:
-            return
+    def __append_children(self, widget: Widget, resolved: Sequence) -> None:
+        """Containers that use the append method to add N children"""
+        for child in self.__check_no_null_children(widget, resolved):
+            widget.append(child)
 
-        # Gtk.Box, Gtk.ListBox
-        # Containers that use the append method to add N children
-        if isinstance(widget, Gtk.Box) or isinstance(widget, Gtk.ListBox):
-            for child in self.__check_no_null_children(widget, resolved):
-                widget.append(child)
+    def __add_children(self, widget: Widget, resolved: Sequence) -> None:
+        """Containers that use the add method to add N children"""
+        for child in self.__check_no_null_children(widget, resolved):
+            widget.add(child)
 
-        # Adw.PreferencesGroup
-        elif isinstance(widget, Adw.PreferencesGroup):
-            for child in self.__check_no_null_children(widget, resolved):
-                widget.add(child)
+    def __set_content_child(self, widget: Widget, resolved: Sequence) -> None:
+        self.__check_n_children(widget, 1, resolved)
+        widget.set_content(resolved[0])
 
-        # Adw.ApplicationWindow
-        elif isinstance(widget, Adw.ApplicationWindow):
-            self.__check_n_children(widget, 1, resolved)
-            widget.set_content(resolved[0])
-
-        # Adw.ToolbarView
+    def __set_toolbar_view_child(self, widget: Widget, resolved: Sequence) -> None:
         # Note: to set top and bottom toolbars, use the TypedChild method
-        elif isinstance(widget, Adw.ToolbarView):
-            try:
-                self.__check_n_children(widget, 1, resolved)
-            except ValueError as e:
-                logging.info("Adw.ToolbarView can only receive one untyped child.")
-                logging.info("To set top and bottom bars, use TypedChild")
-                raise e
-            widget.set_content(resolved[0])
-
-        # Gtk.CenterBox
-        elif isinstance(widget, Gtk.CenterBox):
-            try:
-                self.__check_n_children(widget, 3, resolved)
-            except ValueError as e:
-                logging.info("Gtk.CenterBox must receive 3 untyped children.")
-                logging.info("To set children individually, use TypedChild")
-                raise e
-            start, center, end = resolved
-            widget.set_start_widget(start)
-            widget.set_center_widget(center)
-            widget.set_end_widget(end)
-
-        # Adw.ViewStack, Adw.NavigationView
-        elif isinstance(widget, Adw.ViewStack) or isinstance(
-            widget, Adw.NavigationView
-        ):
-            for child in self.__check_no_null_children(widget, resolved):
-                widget.add(child)
-
-        # Adw.OverlaySplitView
-        elif isinstance(widget, Adw.OverlaySplitView):
-            self.__check_n_children(widget, 2, resolved)
-            sidebar, content = resolved
-            if isinstance(sidebar, Widget):
-                widget.set_sidebar(sidebar)
-            if isinstance(content, Widget):
-                widget.set_content(content)
-
-        # Gtk.HeaderBar, Adw.HeaderBar
-        elif isinstance(widget, Gtk.HeaderBar) or isinstance(widget, Adw.HeaderBar):
+        try:
             self.__check_n_children(widget, 1, resolved)
-            widget.set_title_widget(resolved[0])
+        except ValueError as e:
+            logging.info("Adw.ToolbarView can only receive one untyped child.")
+            logging.info("To set top and bottom bars, use TypedChild")
+            raise e
+        widget.set_content(resolved[0])
+
+    def __set_center_box_children(self, widget: Widget, resolved: Sequence) -> None:
+        try:
+            self.__check_n_children(widget, 3, resolved)
+        except ValueError as e:
+            logging.info("Gtk.CenterBox must receive 3 untyped children.")
+            logging.info("To set children individually, use TypedChild")
+            raise e
+        start, center, end = resolved
+        widget.set_start_widget(start)
+        widget.set_center_widget(center)
+        widget.set_end_widget(end)
+
+    def __set_split_view_children(self, widget: Widget, resolved: Sequence) -> None:
+        self.__check_n_children(widget, 2, resolved)
+        sidebar, content = resolved
+        if isinstance(sidebar, Widget):
+            widget.set_sidebar(sidebar)
+        if isinstance(content, Widget):
+            widget.set_content(content)
+
+    def __set_title_child(self, widget: Widget, resolved: Sequence) -> None:
+        self.__check_n_children(widget, 1, resolved)
+        widget.set_title_widget(resolved[0])
+
+    def __set_single_child(self, widget: Widget, resolved: Sequence) -> None:
+        """Any other widget with a "set_child" method"""
+        self.__check_n_children(widget, 1, resolved)
+        widget.set_child(resolved[0])  # type: ignore
+
+    __children_appliers: dict[type[Widget], Callable] = {
+        Gtk.Box: __append_children,
+        Gtk.ListBox: __append_children,
+        Adw.PreferencesGroup: __add_children,
+        Adw.ApplicationWindow: __set_content_child,
+        Adw.ToolbarView: __set_toolbar_view_child,
+        Gtk.CenterBox: __set_center_box_children,
+        Adw.ViewStack: __add_children,
+        Adw.NavigationView: __add_children,
+        Adw.OverlaySplitView: __set_split_view_children,
+        Gtk.HeaderBar: __set_title_child,
+        Adw.HeaderBar: __set_title_child,
+    }
+    """Children appliers by widget type"""
+
+    __children_appliers_by_type: dict[type, Callable | None] = {}
+    """Resolved children appliers, cached for every built widget type"""
+
+    @classmethod
+    def __get_children_applier(cls, widget_type: type) -> Callable | None:
+        """
+        Get the children applier for the closest known base type, falling back
+        to the "set_child" method if the type has one.
+        """
+        try:
+            return cls.__children_appliers_by_type[widget_type]
+        except KeyError:
+            pass
+        applier = next(
+            (
+                cls.__children_appliers[base]
+                for base in widget_type.__mro__
+                if base in cls.__children_appliers
+            ),
+            None,
+        )
+        if applier is None and hasattr(widget_type, "set_child"):
+            applier = cls.__set_single_child
+        cls.__children_appliers_by_type[widget_type] = applier
+        return applier
 
-        # Any widget with "set_child"
-        elif getattr(widget, "set_child", None) is not None:
-            self.__check_n_children(widget, 1, resolved)
-            widget.set_child(resolved[0])  # type: ignore
+    def __apply_children(
+        self, widget: Widget, children: Sequence["WidgetBuilder | Widget | None"]
+    ) -> None:
+        # Resolve children from producers
+        resolved = self.__resolve_children(children)
+
+        # Short circuit
+        if not resolved:
+            return
+
+        # Known containers, or any widget with "set_child"
+        if (applier := self.__get_children_applier(type(widget))) is not None:
+            applier(self, widget, resolved)
 
         # Cannot set children
         else:
@@ -256,135 +332,202 @@ class WidgetBuilder(Generic[_BuiltWidget]):
         self, typed_children: Sequence[tuple[str, "WidgetBuilder | Widget"]]
     ) -> Sequence[tuple[str, Widget]]:
         return [
-            (type_, build(child) if isinstance(child, WidgetBuilder) else child)
+            (
+                type_,
+                child.build() if type(child) in _BUILDER_TYPES else child,  # type: ignore
+            )
             for type_, child in typed_children
         ]
 
-    def __apply_typed_children(self, widget: _BuiltWidget) -> None:
-        resolved = self.__resolve_typed_children(self.__typed_children)
+    # Typed children appliers, receiving the widget and its resolved typed children
+
+    def __apply_toolbar_view_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "top":
+                widget.add_top_bar(child)
+            if t == "bottom":
+                widget.add_bottom_bar(child)
+            if t == "content":
+                widget.set_content(child)
+
+    def __apply_header_bar_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "start":
+                widget.pack_start(child)
+            if t == "end":
+                widget.pack_end(child)
+            if t == "title":
+                widget.set_title_widget(child)
+
+    def __apply_action_bar_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "start":
+                widget.pack_start(child)
+            if t == "end":
+                widget.pack_end(child)
+            if t == "center":
+                widget.set_center_widget(child)
+
+    def __apply_row_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "prefix":
+                widget.add_prefix(child)
+            if t == "suffix":
+                widget.add_suffix(child)
+
+    def __apply_split_view_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "sidebar":
+                widget.set_sidebar(child)
+            if t == "content":
+                widget.set_content(child)
+
+    def __apply_preferences_group_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "header-suffix":
+                widget.set_header_suffix(child)
+
+    def __apply_center_box_typed_children(
+        self, widget: Widget, resolved: Sequence[tuple[str, Widget]]
+    ) -> None:
+        for t, child in resolved:
+            if t == "start":
+                widget.set_start_widget(child)
+            if t == "center":
+                widget.set_center_widget(child)
+            if t == "end":
+                widget.set_end_widget(child)
+
+    __typed_children_appliers: dict[type[Widget], Callable] = {
+        Adw.ToolbarView: __apply_toolbar_view_typed_children,
+        Adw.HeaderBar: __apply_header_bar_typed_children,
+        Gtk.ActionBar: __apply_action_bar_typed_children,
+        Adw.ActionRow: __apply_row_typed_children,
+        Adw.EntryRow: __apply_row_typed_children,
+        Adw.OverlaySplitView: __apply_split_view_typed_children,
+        Adw.PreferencesGroup: __apply_preferences_group_typed_children,
+        Gtk.CenterBox: __apply_center_box_typed_children,
+    }
+    """Typed children appliers by widget type"""
+
+    __typed_children_appliers_by_type: dict[type, Callable | None] = {}
+    """Resolved typed children appliers, cached for every built widget type"""
+
+    @classmethod
+    def __get_typed_children_applier(cls, widget_type: type) -> Callable | None:
+        """Get the typed children applier for the closest known base type, if any"""
+        try:
+            return cls.__typed_children_appliers_by_type[widget_type]
+        except KeyError:
+            pass
+        applier = next(
+            (
+                cls.__typed_children_appliers[base]
+                for base in widget_type.__mro__
+                if base in cls.__typed_children_appliers
+            ),
+            None,
+        )
+        cls.__typed_children_appliers_by_type[widget_type] = applier
+        return applier
+
+    def __apply_typed_children(
+        self,
+        widget: _BuiltWidget,
+        typed_children: Sequence[tuple[str, "WidgetBuilder | Widget"]],
+    ) -> None:
+        resolved = self.__resolve_typed_children(typed_children)
 
         # Shortcut, there is no typed child
         if not resolved:
             return
 
-        # Adw.ToolbarView
-        if isinstance(widget, Adw.ToolbarView):
-            for t, child in resolved:
-                if t == "top":
-                    widget.add_top_bar(child)
-                if t == "bottom":
-                    widget.add_bottom_bar(child)
-                if t == "content":
-                    widget.set_content(child)
-
-        # Adw.HeaderBar
-        elif isinstance(widget, Adw.HeaderBar):
-            for t, child in resolved:
-                if t == "start":
-                    widget.pack_start(child)
-                if t == "end":
-                    widget.pack_end(child)
-                if t == "title":
-                    widget.set_title_widget(child)
-
-        # Gtk.ActionBar
-        elif isinstance(widget, Gtk.ActionBar):
-            for t, child in resolved:
-                if t == "start":
-                    widget.pack_start(child)
-                if t == "end":
-                    widget.pack_end(child)
-                if t == "center":
-                    widget.set_center_widget(child)
-
-        # Adw.ActionRow
-        # Adw.EntryRow
-        elif isinstance(widget, Adw.ActionRow) or isinstance(widget, Adw.EntryRow):
-            for t, child in resolved:
-                if t == "prefix":
-                    widget.add_prefix(child)
-                if t == "suffix":
-                    widget.add_suffix(child)
-
-        # Adw.OverlaySplitView
-        elif isinstance(widget, Adw.OverlaySplitView):
-            for t, child in resolved:
-                if t == "sidebar":
-                    widget.set_sidebar(child)
-                if t == "content":
-                    widget.set_content(child)
-
-        # Adw.PreferencesGroup
-        elif isinstance(widget, Adw.PreferencesGroup):
-            for t, child in resolved:
-                if t == "header-suffix":
-                    widget.set_header_suffix(child)
-
-        # Gtk.CenterBox
-        elif isinstance(widget, Gtk.CenterBox):
-            for t, child in resolved:
-                if t == "start":
-                    widget.set_start_widget(child)
-                if t == "center":
-                    widget.set_center_widget(child)
-                if t == "end":
-                    widget.set_end_widget(child)
-
-    def __apply_property_bindings(self, widget: _BuiltWidget) -> None:
+        # Note: widgets that don't support typed children ignore them
+        if (applier := self.__get_typed_children_applier(type(widget))) is not None:
+            applier(self, widget, resolved)
+
+    def __apply_property_bindings(
+        self, widget: _BuiltWidget, bindings: Sequence[Binding]
+    ) -> None:
         """Apply property bindings to the widget"""
-        for binding in self.__property_bindings:
-            match binding:
-                case InboundBinding():
-                    binding.source.bind_property(
-                        binding.source_property,
-                        widget,
-                        binding.target_property,
-                        binding.flags,
-                    )
-                case OutboundBinding():
-                    widget.bind_property(
-                        binding.source_property,
-                        binding.target,
-                        binding.target_property,
-                        binding.flags,
-                    )
-                case _:
-                    message = "Unknown binding type %s" % binding.__class__.__name__
-                    raise TypeError(message)
+        for binding in bindings:
+            binding_type = type(binding)
+            if binding_type is InboundBinding:
+                binding.source.bind_property(  # type: ignore
+                    binding.source_property,
+                    widget,
+                    binding.target_property,
+                    binding.flags,
+                )
+            elif binding_type is OutboundBinding:
+                widget.bind_property(
+                    binding.source_property,
+                    binding.target,  # type: ignore
+                    binding.target_property,
+                    binding.flags,
+                )
+            else:
+                message = "Unknown binding type %s" % binding.__class__.__name__
+                raise TypeError(message)
 
     def build(self) -> _BuiltWidget:
         """Build the widget"""
         if not callable(self.__widget_class):
             raise ValueError("Cannot build without a widget class")
-        widget = self.__widget_class(**self.__arguments)
-        self.__apply_handlers(widget)
-        self.__apply_properties(widget)
-        self.__apply_children(widget)
-        self.__apply_typed_children(widget)
-        self.__apply_property_bindings(widget)
+
+        # Gather the ops by tag in a single pass
+        arguments: dict[str, Any] = {}
+        handlers: dict[str, Any] = {}
+        properties: dict[str, Any] = {}
+        children: list["WidgetBuilder | Widget | None"] = []
+        typed_children: list[tuple[str, "WidgetBuilder | Widget"]] = []
+        bindings: list[Binding] = []
+        for tag, payload in self.__ops:
+            if tag == _OP_PROPERTIES:
+                properties.update(payload)
+            elif tag == _OP_CHILDREN:
+                children.extend(payload)
+            elif tag == _OP_HANDLERS:
+                handlers.update(payload)
+            elif tag == _OP_TYPED_CHILDREN:
+                typed_children.extend(payload)
+            elif tag == _OP_PROPERTY_BINDINGS:
+                bindings.extend(payload)
+            else:
+                arguments.update(payload)
+
+        widget = self.__widget_class(**arguments)
+        if handlers:
+            self.__apply_handlers(widget, handlers)
+        if properties:
+            self.__apply_properties(widget, properties)
+        if children:
+            self.__apply_children(widget, children)
+        if typed_children:
+            self.__apply_typed_children(widget, typed_children)
+        if bindings:
+            self.__apply_property_bindings(widget, bindings)
         return widget
 
     def __add__(
         self, other: "WidgetBuilder[_BuiltWidget]"
     ) -> "WidgetBuilder[_BuiltWidget]":
-        return (
-            WidgetBuilder()
-            .set_widget_class(self.get_widget_class())
-            # Add data from self
-            .add_arguments(**self.get_arguments())
-            .add_handlers(**self.get_handlers())
-            .add_properties(**self.get_properties())
-            .add_children(*self.get_children())
-            .add_typed_children(*self.get_typed_children())
-            .add_property_bindings(*self.get_property_bindings())
-            # Add data from other
-            .add_arguments(**other.get_arguments())
-            .add_handlers(**other.get_handlers())
-            .add_properties(**other.get_properties())
-            .add_children(*other.get_children())
-            .add_typed_children(*other.get_typed_children())
-            .add_property_bindings(*other.get_property_bindings())
-        )
+        # Concatenate the ops, without replaying the adders
+        result: WidgetBuilder[_BuiltWidget] = WidgetBuilder(self.__widget_class)
+        result.__ops = self.__ops + other.__ops
+        return result
 
     def __radd__(self, other: type[Widget]) -> "WidgetBuilder":
         # fmt: off
@@ -402,9 +545,14 @@ class WidgetBuilder(Generic[_BuiltWidget]):
             return builder + self
 
 
+_BUILDER_TYPES.add(WidgetBuilder)
+
+
 class Arguments(WidgetBuilder):
     """A dict of constructor arguments to pass to a builder object"""
 
+    __slots__ = ()
+
     def __init__(self, **arguments: Any) -> None:
         super().__init__()
         self.add_arguments(**arguments)
@@ -413,6 +561,8 @@ class Arguments(WidgetBuilder):
 class Properties(WidgetBuilder):
     """A dict of properties to pass to a builder object"""
 
+    __slots__ = ()
+
     def __init__(self, **properties: Any) -> None:
         super().__init__()
         self.add_properties(**properties)
@@ -421,6 +571,8 @@ class Properties(WidgetBuilder):
 class Handlers(WidgetBuilder):
     """A dict of signal handlers to pass to a builder object"""
 
+    __slots__ = ()
+
     def __init__(self, **handlers: Callable) -> None:
         super().__init__()
         self.add_handlers(**handlers)
@@ -429,6 +581,8 @@ class Handlers(WidgetBuilder):
 class Reemit(WidgetBuilder):
     """Attach a signal handler that re-emits the signal on another object"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         signal: str,
@@ -446,6 +600,8 @@ class Reemit(WidgetBuilder):
 class Children(WidgetBuilder):
     """A list of children to pass to a builder object"""
 
+    __slots__ = ()
+
     def __init__(self, *children: "WidgetBuilder | Widget | None") -> None:
         super().__init__()
         self.add_children(*children)
@@ -454,6 +610,8 @@ class Children(WidgetBuilder):
 class TypedChild(WidgetBuilder):
     """A single typed child to pass to a builder object"""
 
+    __slots__ = ()
+
     def __init__(self, t: str, child: "WidgetBuilder | Widget") -> None:
         super().__init__()
         self.add_typed_children((t, child))
@@ -466,6 +624,8 @@ class OutboundProperty(WidgetBuilder):
     Will replicate changes from source_property on the built widget to target_property on the target object.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         source_property: str,
@@ -491,6 +651,8 @@ class InboundProperty(WidgetBuilder):
     Will replicate changes made to source_property on the source object to the built widget's target_property.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         source: GObject.Object,